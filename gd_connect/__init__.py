@@ -1,6 +1,6 @@
 # gd_connect/__init__.py
 from .auth import get_credentials
-from .drive import GoogleDrive
+from .drive import BatchError, DriveEntry, GoogleDrive
 
-__all__ = ["get_credentials", "GoogleDrive"]
+__all__ = ["get_credentials", "GoogleDrive", "DriveEntry", "BatchError"]
 __version__ = "0.1.0"
\ No newline at end of file
@@ -1,7 +1,12 @@
 import argparse
 import sys
 
-from .drive import GoogleDrive, FOLDER_MIME
+from googleapiclient.errors import HttpError
+
+from .drive import (
+    BatchError, GoogleDrive, FOLDER_MIME, DEFAULT_WORKERS, MULTIPART_THRESHOLD, UPLOAD_WORKERS,
+    has_magic,
+)
 
 
 def print_list(items):
@@ -21,17 +26,30 @@ def build_parser():
   gd-connect cd /Projects/Reports
   gd-connect upload ./local.txt
   gd-connect upload ./local.txt /Projects/NewName.txt
+  gd-connect upload ./data/*.json /Projects/Raw/
   gd-connect download /Projects/NewName.txt ./local_copy.txt
   gd-connect mv report.txt /Projects/Archive/
   gd-connect mv report.txt renamed.txt
   gd-connect cp report.txt /Projects/Backup/
   gd-connect rm /Projects/Old/file.txt
+  gd-connect rm '/logs/2026-*/*.tmp'
+  gd-connect download '/exports/*.csv' ./out/
+  gd-connect ls '/Projects/**/*.pdf'
+  gd-connect ls //
+  gd-connect cd //Engineering/Specs
   gd-connect is-exist /Projects/Notes.txt
   gd-connect is-dir /Projects
   gd-connect search budget
+  gd-connect search --name report --path /Projects -r --limit 20
+  gd-connect search --mimeType application/pdf --min-size 1048576
 Tips:
 - Paths can be relative (note.txt) or absolute (/Team/note.txt).
 - Use '..' and '.' just like a shell. 'cd /' goes to root.
+- '//Name/path' addresses the shared drive called Name; 'ls //' lists shared drives.
+- Remote paths accept globs (*, ?, [...], **); quote them so your shell doesn't expand them.
+  A pattern that matches nothing is used as a literal name (e.g. 'Reports [2026]').
+  Inside a pattern, write '[[]' for a literal '[' and '[?]' for a literal '?':
+  gd-connect ls '/Reports [[]2026]/*.pdf'
 """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -40,29 +58,37 @@ Tips:
     sub.add_parser("pwd", help="Print current directory")
 
     ls = sub.add_parser("ls", help="List files in a folder")
-    ls.add_argument("path", nargs="?", help="Folder path (default: cwd)")
+    ls.add_argument("path", nargs="?", help="Folder path or glob (default: cwd)")
 
     cd = sub.add_parser("cd", help="Change current directory")
     cd.add_argument("path", help="Path to folder")
 
-    up = sub.add_parser("upload", help="Upload local file to Drive")
-    up.add_argument("local", help="Local file path")
-    up.add_argument("remote", nargs="?", help="Remote path or folder (default: cwd)")
+    up = sub.add_parser("upload", help="Upload local files to Drive")
+    up.add_argument("paths", nargs="+", metavar="path",
+                    help="Local file(s); with several arguments the last one is the "
+                         "remote path or folder (default: cwd)")
+    up.add_argument("--workers", type=int, default=UPLOAD_WORKERS,
+                    help=f"Parallel uploads for several files (default: {UPLOAD_WORKERS})")
+    up.add_argument("--multipart-threshold", type=int, default=MULTIPART_THRESHOLD,
+                    help="Files up to this many bytes upload in one request; "
+                         f"larger ones are resumable (default: {MULTIPART_THRESHOLD})")
 
     down = sub.add_parser("download", help="Download Drive file to local path")
-    down.add_argument("remote", help="Remote file path")
-    down.add_argument("local", help="Local destination path")
+    down.add_argument("remote", help="Remote file path or glob")
+    down.add_argument("local", help="Local destination path (a folder for globs)")
+    down.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                      help=f"Parallel downloads for globs (default: {DEFAULT_WORKERS})")
 
-    rm = sub.add_parser("rm", help="Remove a file or folder")
-    rm.add_argument("path", help="Path to remove")
+    rm = sub.add_parser("rm", help="Remove files or folders")
+    rm.add_argument("paths", nargs="+", help="Paths or globs to remove")
 
     mv = sub.add_parser("mv", help="Move/rename a file or folder")
-    mv.add_argument("src", help="Source path")
-    mv.add_argument("dst", help="Destination path or folder")
+    mv.add_argument("src", help="Source path or glob")
+    mv.add_argument("dst", help="Destination path or folder (a folder for globs)")
 
     cp = sub.add_parser("cp", help="Copy a file (folders not supported by Drive API)")
-    cp.add_argument("src", help="Source file path")
-    cp.add_argument("dst", help="Destination path or folder")
+    cp.add_argument("src", help="Source file path or glob")
+    cp.add_argument("dst", help="Destination path or folder (a folder for globs)")
 
     ise = sub.add_parser("is-exist", help="Check if a path exists")
     ise.add_argument("path", help="Path to check")
@@ -71,10 +97,18 @@ Tips:
     isd.add_argument("path", help="Path to check")
     
     search_parser = sub.add_parser("search", help="Search files in Google Drive")
+    search_parser.add_argument("query", nargs="?", help="Name contains (same as --name)")
     search_parser.add_argument("--name", help="Search by file/folder name")
     search_parser.add_argument("--mimeType", help="Search by MIME type (e.g. application/pdf)")
     search_parser.add_argument("--modified-after", help="Search files modified after YYYY-MM-DD")
     search_parser.add_argument("--modified-before", help="Search files modified before YYYY-MM-DD")
+    search_parser.add_argument("--min-size", type=int, help="Minimum size in bytes")
+    search_parser.add_argument("--max-size", type=int, help="Maximum size in bytes")
+    search_parser.add_argument("--owner", help="Owner email address")
+    search_parser.add_argument("--path", help="Only search inside this folder (default: whole Drive)")
+    search_parser.add_argument("-r", "--recursive", action="store_true",
+                               help="With --path, also search all subfolders")
+    search_parser.add_argument("--limit", type=int, help="Stop after this many results")
 
 
     return parser
@@ -102,24 +136,50 @@ def main():
             print(f"📂 Changed directory to: {new_path}")
 
         elif args.cmd == "upload":
-            created = d.upload(args.local, args.remote)
-            print(f"⬆️  Uploaded: {created.get('name')} (id={created.get('id')})")
+            if len(args.paths) <= 2:
+                local, remote = args.paths[0], (args.paths[1:] or [None])[0]
+                created = [d.upload(local, remote, args.multipart_threshold)]
+            else:
+                created = d.upload_many(
+                    args.paths[:-1], args.paths[-1], args.workers, args.multipart_threshold
+                )
+            for c in created:
+                print(f"⬆️  Uploaded: {c.get('name')} (id={c.get('id')})")
 
         elif args.cmd == "download":
-            d.download(args.remote, args.local)
-            print(f"⬇️  Downloaded: {args.remote} → {args.local}")
+            matches = d.glob_matches(args.remote)
+            if matches:
+                for remote, local in d.download_many(matches, args.local, args.workers):
+                    print(f"⬇️  Downloaded: {remote} → {local}")
+            else:
+                d.download(args.remote, args.local)
+                print(f"⬇️  Downloaded: {args.remote} → {args.local}")
 
         elif args.cmd == "rm":
-            d.rm(args.path)
-            print(f"🗑️  Removed: {args.path}")
+            if len(args.paths) == 1 and not has_magic(args.paths[0]):
+                d.rm(args.paths[0])
+                print(f"🗑️  Removed: {args.paths[0]}")
+            else:
+                for path in d.rm_many(args.paths):
+                    print(f"🗑️  Removed: {path}")
 
         elif args.cmd == "mv":
-            updated = d.mv(args.src, args.dst)
-            print(f"🔀 Moved/Renamed to: {updated.get('name')}")
+            matches = d.glob_matches(args.src)
+            if matches:
+                for updated in d.mv_many(matches, args.dst):
+                    print(f"🔀 Moved: {updated.get('name')}")
+            else:
+                updated = d.mv(args.src, args.dst)
+                print(f"🔀 Moved/Renamed to: {updated.get('name')}")
 
         elif args.cmd == "cp":
-            created = d.cp(args.src, args.dst)
-            print(f"📄 Copied as: {created.get('name')} (id={created.get('id')})")
+            matches = d.glob_matches(args.src)
+            if matches:
+                for created in d.cp_many(matches, args.dst):
+                    print(f"📄 Copied as: {created.get('name')} (id={created.get('id')})")
+            else:
+                created = d.cp(args.src, args.dst)
+                print(f"📄 Copied as: {created.get('name')} (id={created.get('id')})")
 
         elif args.cmd == "is-exist":
             print("✅ Exists" if d.exists(args.path) else "❌ Not found")
@@ -128,19 +188,25 @@ def main():
             print("📁 Folder" if d.is_dir(args.path) else "📄 File or missing")
 
         elif args.cmd == "search":
-          files = d.search(
-              name=args.name,
-              mimeType=args.mimeType,
-              modified_after=args.modified_after,
-              modified_before=args.modified_before,
-          )
-          if not files:
-              print("❌ No files found.")
-          else:
-              for f in files:
-                  icon = "📁" if f["mimeType"] == "application/vnd.google-apps.folder" else "📄"
-                  print(f"{icon} {f['name']} (id={f['id']}, modified={f['modifiedTime']})")
-  
+            files = d.search(
+                name=args.name or args.query,
+                mimeType=args.mimeType,
+                modified_after=args.modified_after,
+                modified_before=args.modified_before,
+                min_size=args.min_size,
+                max_size=args.max_size,
+                owner=args.owner,
+                path=args.path,
+                recursive=args.recursive,
+                limit=args.limit,
+            )
+            found = False
+            for f in files:
+                found = True
+                icon = "📁" if f.is_dir else "📄"
+                print(f"{icon} {f.name} (id={f.id}, modified={f.modifiedTime})", flush=True)
+            if not found:
+                print("❌ No files found.")
 
     except FileNotFoundError as e:
         print(str(e))
@@ -151,6 +217,13 @@ def main():
     except NotADirectoryError as e:
         print(f"❌ {e}")
         sys.exit(1)
+    except BatchError as e:
+        for label in e.succeeded:
+            print(f"✅ Done: {label}")
+        for label, err in e.failed:
+            print(f"❌ Failed: {label} ({err})")
+        print(f"❌ {e}")
+        sys.exit(1)
     except HttpError as e:
         print(f"❌ API Error: {e}")
         sys.exit(1)
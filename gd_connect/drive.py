@@ -1,18 +1,225 @@
+import fnmatch
 import io
 import json
 import os
 import posixpath
-from typing import List, Dict, Optional
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Iterator, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from googleapiclient.http import (
+    MediaFileUpload, MediaInMemoryUpload, MediaIoBaseDownload,
+)
 
 from .auth import get_credentials
+from .utils import escape_query, guess_mime_type
 
 STATE_FILE = os.path.expanduser("~/.gd_connect_state.json")
 FOLDER_MIME = "application/vnd.google-apps.folder"
+SHARED_PREFIX = "//"       # //SharedDriveName/path addresses a shared drive
+
+GLOB_CHARS = "*?["
+PAGE_SIZE = 1000           # max page size accepted by files().list
+PARENTS_PER_QUERY = 50     # keep "'a' in parents or ..." clauses well under the q length limit
+BATCH_LIMIT = 100          # max calls per batch HTTP request
+BATCH_RETRIES = 5          # retries for rate-limited calls inside a batch
+UPLOAD_RETRIES = 5         # num_retries for uploads (429, 5xx and 403 rate limits)
+RATE_LIMIT_REASONS = {"userRateLimitExceeded", "rateLimitExceeded"}
+DEFAULT_WORKERS = 4
+UPLOAD_WORKERS = 8         # small uploads are latency-bound; keep more in flight
+# Files up to this size go up in one multipart request (metadata + bytes);
+# larger ones use a resumable session, which costs an extra round trip.
+MULTIPART_THRESHOLD = 5 * 1024 * 1024
+
+# Partial-response field sets, so each call only pays for what it uses
+ENTRY_FIELDS = "id,name,mimeType"
+
+
+def has_magic(path: str) -> bool:
+    """True if the path contains glob characters (*, ?, [...])."""
+    return any(c in path for c in GLOB_CHARS)
+
+
+def _rfc3339(value) -> str:
+    """YYYY-MM-DD string or datetime -> RFC 3339 timestamp (UTC) for Drive queries."""
+    if isinstance(value, str):
+        value = datetime.strptime(value, "%Y-%m-%d")
+    return value.strftime("%Y-%m-%dT%H:%M:%S") + "Z"
+
+
+def build_query(
+    name: Optional[str] = None,
+    exact_name: Optional[str] = None,
+    mimeType: Optional[str] = None,
+    modified_after=None,
+    modified_before=None,
+    owner: Optional[str] = None,
+    parents: Optional[Sequence[str]] = None,
+    folders_only: bool = False,
+    trashed: bool = False,
+) -> str:
+    """
+    Compose a Drive `q` string from predicates, AND-ed together.
+    All literals are escaped. `parents` is OR-ed ('a' in parents or 'b' in parents).
+    Drive cannot filter on size server-side; see GoogleDrive.search for that.
+    """
+    clauses = []
+    if parents:
+        clauses.append("(" + " or ".join(f"'{escape_query(p)}' in parents" for p in parents) + ")")
+    if name:
+        clauses.append(f"name contains '{escape_query(name)}'")
+    if exact_name:
+        clauses.append(f"name = '{escape_query(exact_name)}'")
+    if folders_only:
+        clauses.append(f"mimeType = '{FOLDER_MIME}'")
+    elif mimeType:
+        clauses.append(f"mimeType = '{escape_query(mimeType)}'")
+    if modified_after:
+        clauses.append(f"modifiedTime > '{_rfc3339(modified_after)}'")
+    if modified_before:
+        clauses.append(f"modifiedTime < '{_rfc3339(modified_before)}'")
+    if owner:
+        clauses.append(f"'{escape_query(owner)}' in owners")
+    clauses.append(f"trashed = {'true' if trashed else 'false'}")
+    return " and ".join(clauses)
+
+
+def _corpus_args(drive_id: Optional[str]) -> Dict:
+    """files().list arguments selecting the narrowest corpus for a listing."""
+    if drive_id:
+        return {
+            "corpora": "drive",
+            "driveId": drive_id,
+            "includeItemsFromAllDrives": True,
+            "supportsAllDrives": True,
+        }
+    return {"spaces": "drive"}
+
+
+def _build_service(creds):
+    # googleapiclient already negotiates gzip responses (accept-encoding plus a
+    # "(gzip)" user agent) and its default http keeps the 60 s timeout and the
+    # 308 handling resumable uploads rely on, so no custom transport here.
+    return build("drive", "v3", credentials=creds, cache_discovery=False)
+
+
+class DriveEntry:
+    """
+    Compact file entry returned by listings. Uses __slots__ instead of a per-file
+    dict, which matters for listings of hundreds of thousands of files.
+    Fields the call did not request are None as attributes and absent when the
+    entry is used as a read-only mapping (`in`, [], .get(), keys(), items(),
+    dict(entry)), so code written against the old per-file dicts keeps working.
+    One difference: parents is a tuple rather than a list.
+    """
+
+    __slots__ = ("id", "name", "mimeType", "parents", "size", "modifiedTime", "path")
+
+    def __init__(self, id, name, mimeType=None, parents=(), size=None,
+                 modifiedTime=None, path=None):
+        self.id = id
+        self.name = name
+        self.mimeType = mimeType
+        self.parents = tuple(parents)
+        self.size = int(size) if size is not None else None
+        self.modifiedTime = modifiedTime
+        self.path = path
+
+    @classmethod
+    def from_api(cls, data: Dict, path: Optional[str] = None) -> "DriveEntry":
+        return cls(
+            data["id"], data.get("name"), data.get("mimeType"), data.get("parents", ()),
+            data.get("size"), data.get("modifiedTime"), path,
+        )
+
+    @property
+    def is_dir(self) -> bool:
+        return self.mimeType == FOLDER_MIME
+
+    # ---- read-only mapping view over the fields that are set ----
+
+    def keys(self) -> List[str]:
+        return [k for k in self.__slots__ if getattr(self, k) not in (None, ())]
+
+    def items(self) -> List[Tuple[str, object]]:
+        return [(k, getattr(self, k)) for k in self.keys()]
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self else default
+
+    def __contains__(self, key) -> bool:
+        return key in self.__slots__ and getattr(self, key) not in (None, ())
+
+    def __getitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def to_dict(self) -> Dict:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"DriveEntry(id={self.id!r}, name={self.name!r}, path={self.path!r})"
+
+
+class BatchError(Exception):
+    """
+    Some calls of a batched or pooled operation failed for good (after retries).
+    `succeeded` lists the labels of calls that went through; `failed`
+    holds (label, exception) pairs.
+    """
+
+    def __init__(self, succeeded: List[str], failed: List[Tuple[str, Exception]]):
+        self.succeeded = succeeded
+        self.failed = failed
+        super().__init__(
+            f"{len(failed)} of {len(succeeded) + len(failed)} operations failed"
+        )
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Rate-limit (429, 403 *RateLimitExceeded) and server (5xx) errors are worth retrying."""
+    if not isinstance(exc, HttpError):
+        return False
+    status = exc.resp.status
+    if status == 429 or status >= 500:
+        return True
+    if status == 403:
+        details = exc.error_details if isinstance(exc.error_details, list) else []
+        return any(isinstance(d, dict) and d.get("reason") in RATE_LIMIT_REASONS for d in details)
+    return False
+
+
+def _common_prefix(seqs: Sequence[Sequence[str]]) -> List[str]:
+    """Longest list of leading items shared by every sequence."""
+    if not seqs:
+        return []
+    prefix = list(seqs[0])
+    for seq in seqs[1:]:
+        n = 0
+        while n < min(len(prefix), len(seq)) and prefix[n] == seq[n]:
+            n += 1
+        prefix = prefix[:n]
+    return prefix
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Leading part of a glob component that contains no glob characters."""
+    for i, c in enumerate(pattern):
+        if c in GLOB_CHARS:
+            return pattern[:i]
+    return pattern
 
 
 class GoogleDrive:
@@ -23,8 +230,11 @@ class GoogleDrive:
 
     def __init__(self):
         creds = get_credentials()
-        self.service = build("drive", "v3", credentials=creds)
-        self.cwd_path = "/"    # string path like "/Projects"
+        self._creds = creds
+        self.service = _build_service(creds)
+        self._local = threading.local()
+        self._shared_drive_ids: Dict[str, str] = {}   # shared drive name -> id
+        self.cwd_path = "/"    # string path like "/Projects" or "//Team/Projects"
         self._load_state()
 
     # ----------------------- State -----------------------
@@ -58,20 +268,82 @@ class GoogleDrive:
         return posixpath.normpath(f"{base.rstrip('/')}/{add}") or "/"
 
     def normalize_path(self, path: Optional[str]) -> str:
-        """Return absolute POSIX path from cwd + input (supports '.', '..')."""
+        """
+        Return absolute POSIX path from cwd + input (supports '.', '..').
+        A leading '//' addresses a shared drive: //SharedDriveName/path.
+        """
         if not path or path == ".":
             return self.cwd_path
         return self._norm_join(self.cwd_path, path)
 
+    def _split_drive(self, path: str) -> Tuple[Optional[str], str, str]:
+        """
+        Split an absolute path into (shared drive id, drive root path, rest):
+        '//Team/a/b' -> ('<team drive id>', '//Team', 'a/b'); '/a/b' -> (None, '/', 'a/b').
+        """
+        if path.startswith(SHARED_PREFIX) and not path.startswith("///"):
+            name, _, rest = path[len(SHARED_PREFIX):].partition("/")
+            if not name:
+                raise FileNotFoundError("❌ '//' lists shared drives; it is not a folder")
+            return self.get_shared_drive_id(name), SHARED_PREFIX + name, rest.strip("/")
+        return None, "/", path.strip("/")
+
+    # ----------------------- Shared drives -----------------------
+
+    def get_shared_drive_id(self, name: str) -> str:
+        """
+        Resolve a shared drive name to its id (cached). Raises FileNotFoundError
+        if missing and ValueError if several shared drives have that name.
+        """
+        if name not in self._shared_drive_ids:
+            # Names are not unique; fetch two so a duplicate is detected
+            res = self.service.drives().list(
+                q=f"name = '{escape_query(name)}'", pageSize=2, fields="drives(id)"
+            ).execute()
+            drives = res.get("drives", [])
+            if not drives:
+                raise FileNotFoundError(f"❌ No such shared drive: {name}")
+            if len(drives) > 1:
+                raise ValueError(f"❌ Ambiguous shared drive name: {name} (several drives use it)")
+            self._shared_drive_ids[name] = drives[0]["id"]
+        return self._shared_drive_ids[name]
+
+    def list_shared_drives(self) -> List[DriveEntry]:
+        """All shared drives the user can see, as folder entries with //Name paths."""
+        entries = []
+        page_token = None
+        while True:
+            res = self.service.drives().list(
+                pageSize=100, pageToken=page_token,
+                fields="nextPageToken, drives(id,name)",
+            ).execute()
+            for d in res.get("drives", []):
+                entries.append(DriveEntry(d["id"], d["name"], FOLDER_MIME,
+                                          path=SHARED_PREFIX + d["name"]))
+            page_token = res.get("nextPageToken")
+            if not page_token:
+                break
+        # Only cache names that are unique; duplicates must fail in get_shared_drive_id
+        counts: Dict[str, int] = {}
+        for e in entries:
+            counts[e.name] = counts.get(e.name, 0) + 1
+        for e in entries:
+            if counts[e.name] == 1:
+                self._shared_drive_ids[e.name] = e.id
+            else:
+                self._shared_drive_ids.pop(e.name, None)
+        return entries
+
     # ----------------------- Drive resolution -----------------------
 
-    def _get_child_by_name(self, parent_id: str, name: str) -> Optional[Dict]:
-        q = (
-            f"'{parent_id}' in parents and name = '{name}' and trashed = false"
-        )
+    def _get_child_by_name(
+        self, parent_id: str, name: str, drive_id: Optional[str] = None
+    ) -> Optional[Dict]:
+        q = build_query(parents=[parent_id], exact_name=name)
         res = self.service.files().list(
-            q=q, spaces="drive",
-            fields="files(id,name,mimeType)"
+            q=q, pageSize=1,
+            fields="files(id)",
+            **_corpus_args(drive_id)
         ).execute()
         files = res.get("files", [])
         return files[0] if files else None
@@ -81,40 +353,69 @@ class GoogleDrive:
         return "root"
 
     def get_id_from_path(self, path: str) -> str:
-        """Resolve a /a/b style path to a file ID. Raises FileNotFoundError if missing."""
+        """
+        Resolve a /a/b or //SharedDrive/a/b path to a file ID.
+        Raises FileNotFoundError if missing.
+        """
         if path == "/" or path == "":
             return self._get_root_id()
 
-        parts = [p for p in path.strip("/").split("/") if p]
-        parent_id = self._get_root_id()
+        drive_id, _, rest = self._split_drive(path)
+        parts = [p for p in rest.split("/") if p]
+        parent_id = drive_id or self._get_root_id()
         for part in parts:
-            child = self._get_child_by_name(parent_id, part)
+            child = self._get_child_by_name(parent_id, part, drive_id)
             if not child:
                 raise FileNotFoundError(f"❌ No such file or folder: {path}")
             parent_id = child["id"]
         return parent_id
 
-    def get_meta(self, path: str) -> Dict:
+    def get_meta(self, path: str, fields: str = "id,name,mimeType,parents") -> Dict:
         """Return file metadata for a path (raises if missing)."""
         file_id = self.get_id_from_path(path)
         return self.service.files().get(
-            fileId=file_id, fields="id,name,mimeType,parents"
+            fileId=file_id, fields=fields, supportsAllDrives=True
         ).execute()
 
     def exists(self, path: str) -> bool:
         try:
+            if self.glob_matches(path):
+                return True
             _ = self.get_id_from_path(path)
             return True
-        except FileNotFoundError:
+        except (FileNotFoundError, ValueError):
+            # ValueError: ambiguous shared drive name
             return False
 
     def is_dir(self, path: str) -> bool:
+        """True for a folder, or a glob matching exactly one folder (as cd requires)."""
         try:
-            meta = self.get_meta(path)
+            if self._glob_folder(path):
+                return True
+            meta = self.get_meta(path, fields="mimeType")
             return meta.get("mimeType") == FOLDER_MIME
-        except FileNotFoundError:
+        except (FileNotFoundError, NotADirectoryError, ValueError):
             return False
 
+    def _glob_folder(self, path: str) -> Optional[DriveEntry]:
+        """
+        The single folder a glob matches, or None if path is not a glob or
+        matches nothing (resolve it literally then). Raises NotADirectoryError
+        if the glob matches no folder or several.
+        """
+        matches = self.glob_matches(path)
+        if not matches:
+            return None
+        folders = [e for e in matches if e.is_dir]
+        if len(folders) != 1:
+            raise NotADirectoryError(f"❌ Pattern must match exactly one folder: {path}")
+        return folders[0]
+
+    def _folder_id(self, path: str) -> str:
+        """Folder id for a literal path or a glob matching exactly one folder."""
+        folder = self._glob_folder(path)
+        return folder.id if folder else self.get_id_from_path(path)
+
     # ----------------------- Navigation -----------------------
 
     def pwd(self) -> str:
@@ -122,8 +423,11 @@ class GoogleDrive:
 
     def cd(self, path: str) -> str:
         """Change current directory. Supports '/', '.', '..', absolute & relative."""
+        folder = self._glob_folder(path)
+        if folder:
+            path = folder.path
         abs_path = self.normalize_path(path)
-        meta = self.get_meta(abs_path)
+        meta = self.get_meta(abs_path, fields="mimeType")
         if meta.get("mimeType") != FOLDER_MIME:
             raise NotADirectoryError(f"❌ Not a folder: {abs_path}")
         self.cwd_path = abs_path
@@ -132,63 +436,327 @@ class GoogleDrive:
 
     # ----------------------- Listing & Search -----------------------
 
-    def ls(self, path: Optional[str] = None) -> List[Dict]:
-        """List files in folder. Returns list of metadata dicts."""
+    def ls(self, path: Optional[str] = None, fields: str = ENTRY_FIELDS) -> List[DriveEntry]:
+        """List files in folder (all pages), the matches of a glob, or shared drives for '//'."""
+        matches = self.glob_matches(path) if path else []
+        if matches:
+            return matches
         folder_path = self.normalize_path(path) if path else self.cwd_path
+        if folder_path == SHARED_PREFIX:
+            return self.list_shared_drives()
+        drive_id = self._split_drive(folder_path)[0]
         folder_id = self.get_id_from_path(folder_path)
-        res = self.service.files().list(
-            q=f"'{folder_id}' in parents and trashed = false",
-            spaces="drive",
-            fields="files(id,name,mimeType)"
-        ).execute()
-        return res.get("files", [])
+        return [
+            DriveEntry.from_api(f)
+            for f in self._iter_children([folder_id], fields=fields, drive_id=drive_id)
+        ]
+
+    def search(
+        self,
+        name: Optional[str] = None,
+        mimeType: Optional[str] = None,
+        modified_after=None,
+        modified_before=None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        owner: Optional[str] = None,
+        path: Optional[str] = None,
+        recursive: bool = False,
+        limit: Optional[int] = None,
+        fields: str = ENTRY_FIELDS + ",modifiedTime",
+    ) -> Iterator[DriveEntry]:
+        """
+        Search files, yielding results page by page as they arrive.
+        - name: name contains; mimeType: exact MIME type; owner: owner email.
+        - modified_after / modified_before: YYYY-MM-DD or datetime.
+        - min_size / max_size: bytes, filtered locally (Drive can't query size);
+          folders and native Google files have no size and never match.
+        - path: restrict to this folder (whole My Drive if None; a //SharedDrive
+          path searches that drive's corpus); recursive also searches every
+          folder below it.
+        - limit: stop after this many results.
+        """
+        predicates = dict(
+            name=name, mimeType=mimeType, modified_after=modified_after,
+            modified_before=modified_before, owner=owner,
+        )
+        sized = min_size is not None or max_size is not None
+        if sized and "size" not in fields.split(","):
+            fields += ",size"
+        page_size = min(limit, PAGE_SIZE) if limit else PAGE_SIZE
 
-    def search(self, query: str, path: Optional[str] = None) -> List[Dict]:
-        """Search by name contains within a folder (default: cwd)."""
-        folder_path = self.normalize_path(path) if path else self.cwd_path
-        folder_id = self.get_id_from_path(folder_path)
-        q = (
-            f"'{folder_id}' in parents and name contains '{query}' and trashed = false"
+        if path is None:
+            files = self._list(build_query(**predicates), fields, page_size)
+        else:
+            abs_path = self.normalize_path(path)
+            drive_id, _, rest = self._split_drive(abs_path)
+            if drive_id and not rest and recursive:
+                # Whole shared drive: its corpus already is the subtree
+                files = self._list(build_query(**predicates), fields, page_size, drive_id)
+            else:
+                folder_id = self.get_id_from_path(abs_path)
+                files = self._iter_tree([folder_id], recursive, fields, page_size,
+                                        drive_id=drive_id, **predicates)
+
+        count = 0
+        for f in files:
+            entry = DriveEntry.from_api(f)
+            if sized and (
+                entry.size is None
+                or (min_size is not None and entry.size < min_size)
+                or (max_size is not None and entry.size > max_size)
+            ):
+                continue
+            yield entry
+            count += 1
+            if limit and count >= limit:
+                return
+
+    # ----------------------- Globbing -----------------------
+
+    def _list(
+        self, q: str, fields: str, page_size: int = PAGE_SIZE, drive_id: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Yield files matching q, fetching the next page only when the caller
+        gets there. `fields` is the per-file projection (without files(...)).
+        With drive_id, only that shared drive's corpus is searched.
+        """
+        page_token = None
+        while True:
+            res = self.service.files().list(
+                q=q,
+                pageSize=page_size,
+                pageToken=page_token,
+                fields=f"nextPageToken, files({fields})",
+                **_corpus_args(drive_id)
+            ).execute()
+            yield from res.get("files", [])
+            page_token = res.get("nextPageToken")
+            if not page_token:
+                break
+
+    def _iter_children(
+        self,
+        parent_ids: Sequence[str],
+        fields: str = ENTRY_FIELDS + ",parents",
+        page_size: int = PAGE_SIZE,
+        drive_id: Optional[str] = None,
+        **predicates,
+    ) -> Iterator[Dict]:
+        """
+        Yield children of several folders at once. Parents are OR'd together in
+        groups of PARENTS_PER_QUERY so one listing covers many folders;
+        predicates are build_query() keywords that narrow it server-side.
+        """
+        parent_ids = list(parent_ids)
+        for i in range(0, len(parent_ids), PARENTS_PER_QUERY):
+            group = parent_ids[i:i + PARENTS_PER_QUERY]
+            yield from self._list(
+                build_query(parents=group, **predicates), fields, page_size, drive_id
+            )
+
+    def _iter_tree(
+        self,
+        folder_ids: Sequence[str],
+        recursive: bool,
+        fields: str,
+        page_size: int = PAGE_SIZE,
+        drive_id: Optional[str] = None,
+        **predicates,
+    ) -> Iterator[Dict]:
+        """
+        Yield matches inside folder_ids and, if recursive, every folder below,
+        one level at a time: each level's matches stream out before its
+        subfolders are expanded with batched `in parents` queries.
+        """
+        level = list(folder_ids)
+        while level:
+            yield from self._iter_children(level, fields, page_size, drive_id, **predicates)
+            if not recursive:
+                return
+            level = [
+                f["id"]
+                for f in self._iter_children(level, "id", drive_id=drive_id, folders_only=True)
+            ]
+
+    def _expand_level(
+        self, frontier: Dict[str, str], part: str, folders_only: bool,
+        drive_id: Optional[str] = None,
+    ) -> Dict[Tuple[str, str], DriveEntry]:
+        """
+        Match one path component against the children of every folder in frontier.
+        Keyed by (path, id): Drive allows several files with the same name in a folder.
+        """
+        if not has_magic(part):
+            predicates = {"exact_name": part}
+        else:
+            predicates = {"name": _literal_prefix(part)}
+
+        matches: Dict[Tuple[str, str], DriveEntry] = {}
+        children = self._iter_children(
+            frontier, drive_id=drive_id, folders_only=folders_only, **predicates
         )
-        res = self.service.files().list(
-            q=q, spaces="drive",
-            fields="files(id,name,mimeType)"
-        ).execute()
-        return res.get("files", [])
+        for child in children:
+            if not fnmatch.fnmatchcase(child["name"], part):
+                continue
+            for pid in child.get("parents", []):
+                if pid in frontier:
+                    path = posixpath.join(frontier[pid], child["name"])
+                    matches[(path, child["id"])] = DriveEntry.from_api(child, path)
+        return matches
+
+    def _descendants(
+        self, frontier: Dict[str, str], folders_only: bool, drive_id: Optional[str] = None
+    ) -> Dict[Tuple[str, str], DriveEntry]:
+        """All entries below the frontier folders, walked breadth-first one level per query batch."""
+        found: Dict[Tuple[str, str], DriveEntry] = {}
+        level = frontier
+        while level:
+            children = self._expand_level(level, "*", folders_only, drive_id)
+            found.update(children)
+            level = {e.id: e.path for e in children.values() if e.is_dir}
+        return found
+
+    def glob(self, pattern: str) -> List[DriveEntry]:
+        """
+        Expand a glob pattern (*, ?, [...], **) into matching entries.
+        Literal components are resolved with `name =` and wildcard components with
+        `name contains <literal prefix>`; the remainder is matched locally.
+        A //SharedDrive prefix must name the drive literally.
+        Returned entries have .path set.
+        """
+        drive_id, root_path, rest = self._split_drive(self.normalize_path(pattern))
+        parts = [p for p in rest.split("/") if p]
+        frontier = {drive_id or self._get_root_id(): root_path}   # folder id -> path
+        matches: Dict[Tuple[str, str], DriveEntry] = {}   # (path, id) -> entry
+
+        for i, part in enumerate(parts):
+            last = i == len(parts) - 1
+            if part == "**":
+                # Zero or more folders; as the final component, everything below
+                below = self._descendants(frontier, not last, drive_id)
+                if last:
+                    matches = below
+                    break
+                frontier = dict(frontier)
+                frontier.update((e.id, e.path) for e in below.values())
+                continue
+            matches = self._expand_level(frontier, part, not last, drive_id)
+            if not last:
+                frontier = {e.id: e.path for e in matches.values()}
+            if not matches:
+                break
+
+        return [matches[key] for key in sorted(matches)]
+
+    def glob_matches(self, path: str) -> List[DriveEntry]:
+        """
+        Glob matches for path, or [] if it has no glob characters or matches
+        nothing. Callers then resolve it literally, so names such as
+        'Reports [2026]' or 'What?.txt' keep working; '[[]' and '[?]' match
+        '[' and '?' inside a pattern.
+        """
+        return self.glob(path) if has_magic(path) else []
+
+    def expand(self, path: str) -> List[DriveEntry]:
+        """
+        Resolve a glob, or failing that the literal path, to entries.
+        Raises FileNotFoundError if neither exists.
+        """
+        entries = self.glob_matches(path)
+        if entries:
+            return entries
+        abs_path = self.normalize_path(path)
+        return [DriveEntry.from_api(self.get_meta(abs_path), abs_path)]
+
+    def _entries(self, sources: Union[str, Sequence[DriveEntry]]) -> List[DriveEntry]:
+        """Entries from a path/glob, or an already-resolved list (e.g. from glob_matches)."""
+        return self.expand(sources) if isinstance(sources, str) else list(sources)
 
     # ----------------------- Upload / Download -----------------------
 
-    def upload(self, local_path: str, remote_path: Optional[str] = None) -> Dict:
+    def upload(
+        self,
+        local_path: str,
+        remote_path: Optional[str] = None,
+        multipart_threshold: int = MULTIPART_THRESHOLD,
+    ) -> Dict:
         """
         Upload local file to Drive.
         - If remote_path is None: upload into cwd with same filename.
         - If remote_path resolves to an existing folder: upload into it (same basename).
         - Else: treat remote_path as a full path with target filename (parent must exist).
+        Files up to multipart_threshold bytes are sent in a single multipart
+        request; larger files use a resumable upload.
         """
         if not os.path.isfile(local_path):
             raise FileNotFoundError(f"❌ Local file not found: {local_path}")
 
         if not remote_path:
-            parent_path = self.cwd_path
+            parent_id = self._folder_id(self.cwd_path)
             name = os.path.basename(local_path)
         else:
-            abs_remote = self.normalize_path(remote_path)
-            if self.exists(abs_remote) and self.is_dir(abs_remote):
-                parent_path = abs_remote
-                name = os.path.basename(local_path)
-            else:
-                parent_path = posixpath.dirname(abs_remote) or "/"
-                if not self.exists(parent_path) or not self.is_dir(parent_path):
-                    raise FileNotFoundError(f"❌ Parent folder missing: {parent_path}")
-                name = posixpath.basename(abs_remote)
-
-        parent_id = self.get_id_from_path(parent_path)
-        file_metadata = {"name": name, "parents": [parent_id]}
-        media = MediaFileUpload(local_path, resumable=True)
-        created = self.service.files().create(
-            body=file_metadata, media_body=media, fields="id,name"
-        ).execute()
-        return created
+            parent_id, name = self._resolve_dest(
+                self.normalize_path(remote_path), os.path.basename(local_path)
+            )
+        return self._upload_to(self.service, local_path, parent_id, name, multipart_threshold)
+
+    def _upload_to(
+        self, service, local_path: str, parent_id: str, name: str, multipart_threshold: int
+    ) -> Dict:
+        mimetype = guess_mime_type(local_path)
+        if os.path.getsize(local_path) <= multipart_threshold:
+            # Read small files whole so the handle is closed before the request
+            with open(local_path, "rb") as fh:
+                media = MediaInMemoryUpload(fh.read(), mimetype=mimetype, resumable=False)
+        else:
+            media = MediaFileUpload(local_path, mimetype=mimetype, resumable=True)
+        return service.files().create(
+            body={"name": name, "parents": [parent_id]},
+            media_body=media,
+            fields="id,name",
+            supportsAllDrives=True,
+        ).execute(num_retries=UPLOAD_RETRIES)
+
+    def upload_many(
+        self,
+        local_paths: Sequence[str],
+        remote_folder: Optional[str] = None,
+        workers: int = UPLOAD_WORKERS,
+        multipart_threshold: int = MULTIPART_THRESHOLD,
+    ) -> List[Dict]:
+        """
+        Upload many local files into one existing folder (default: cwd), keeping
+        several requests in flight. Each worker thread reuses its own keep-alive
+        connection, so small files cost one multipart request each.
+        Rate-limited requests are retried with backoff. Returns created metadata
+        in input order; if some files still fail, raises BatchError naming the
+        local paths that were uploaded and those that were not.
+        """
+        missing = [p for p in local_paths if not os.path.isfile(p)]
+        if missing:
+            raise FileNotFoundError(f"❌ Local file not found: {missing[0]}")
+        parent_id = self._require_folder(remote_folder or self.cwd_path)
+
+        def run(local_path):
+            try:
+                return self._upload_to(
+                    self._thread_service(), local_path, parent_id,
+                    os.path.basename(local_path), multipart_threshold,
+                ), None
+            except (HttpError, OSError) as exc:
+                return None, exc
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            results = list(pool.map(run, local_paths))
+
+        failed = [(p, exc) for p, (_, exc) in zip(local_paths, results) if exc is not None]
+        if failed:
+            raise BatchError(
+                [p for p, (_, exc) in zip(local_paths, results) if exc is None], failed
+            )
+        return [created for created, _ in results]
 
     def download(self, remote_path: str, local_path: str) -> None:
         """
@@ -196,7 +764,10 @@ class GoogleDrive:
         Note: Native Google Docs/Sheets/Slides need 'export'; this method handles binary files.
         """
         file_id = self.get_id_from_path(self.normalize_path(remote_path))
-        request = self.service.files().get_media(fileId=file_id)
+        self._download_id(self.service, file_id, local_path)
+
+    def _download_id(self, service, file_id: str, local_path: str) -> None:
+        request = service.files().get_media(fileId=file_id, supportsAllDrives=True)
         os.makedirs(os.path.dirname(os.path.abspath(local_path)) or ".", exist_ok=True)
         with io.FileIO(local_path, "wb") as fh:
             downloader = MediaIoBaseDownload(fh, request)
@@ -204,11 +775,173 @@ class GoogleDrive:
             while not done:
                 _, done = downloader.next_chunk()
 
+    def _thread_service(self):
+        """Per-thread Drive client; the shared httplib2 connection is not thread-safe."""
+        service = getattr(self._local, "service", None)
+        if service is None:
+            service = _build_service(self._creds)
+            self._local.service = service
+        return service
+
+    def download_many(
+        self,
+        sources: Union[str, Sequence[DriveEntry]],
+        local_dir: str,
+        workers: int = DEFAULT_WORKERS,
+    ) -> List[Tuple[str, str]]:
+        """
+        Download every file matching a path/glob (or given entries) into
+        local_dir, several at a time. Folders are skipped. Files keep their
+        path below the deepest folder common to all matches, so '/**/*.csv'
+        yields local_dir/x/data.csv and local_dir/y/data.csv.
+        Raises ValueError before downloading if two files would still land
+        on the same local path (Drive allows duplicate names in a folder).
+        Returns (remote_path, local_path) pairs.
+        """
+        files = [e for e in self._entries(sources) if not e.is_dir]
+        parts = [e.path.strip("/").split("/") for e in files]
+        common = _common_prefix([p[:-1] for p in parts])
+
+        jobs, seen = [], {}
+        for e, p in zip(files, parts):
+            local_path = os.path.join(local_dir, *p[len(common):])
+            key = os.path.normcase(os.path.abspath(local_path))
+            if key in seen:
+                raise ValueError(
+                    f"❌ {seen[key]} and {e.path} would both download to {local_path}"
+                )
+            seen[key] = e.path
+            jobs.append((e.path, e.id, local_path))
+        os.makedirs(local_dir, exist_ok=True)
+
+        def run(job):
+            _, file_id, local_path = job
+            self._download_id(self._thread_service(), file_id, local_path)
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            list(pool.map(run, jobs))
+        return [(remote, local) for remote, _, local in jobs]
+
     # ----------------------- Remove / Move / Copy -----------------------
 
     def rm(self, path: str) -> None:
         file_id = self.get_id_from_path(self.normalize_path(path))
-        self.service.files().delete(fileId=file_id).execute()
+        self.service.files().delete(fileId=file_id, supportsAllDrives=True).execute()
+
+    def _batch_execute(self, requests: Sequence, labels: Sequence[str]) -> List[Dict]:
+        """
+        Run many API calls as batch HTTP requests (BATCH_LIMIT per round trip).
+        Calls that hit rate limits or server errors are re-sent with exponential
+        backoff, up to BATCH_RETRIES times. Returns responses in input order.
+        Raises BatchError, naming what succeeded and what failed (by label),
+        if any call still fails.
+        """
+        responses: List[Optional[Dict]] = [None] * len(requests)
+        failures: Dict[int, Exception] = {}
+
+        def callback(request_id, response, exception):
+            idx = int(request_id)
+            if exception is not None:
+                failures[idx] = exception
+            else:
+                failures.pop(idx, None)
+                responses[idx] = response
+
+        pending = list(range(len(requests)))
+        for attempt in range(BATCH_RETRIES + 1):
+            for i in range(0, len(pending), BATCH_LIMIT):
+                batch = self.service.new_batch_http_request(callback=callback)
+                for idx in pending[i:i + BATCH_LIMIT]:
+                    batch.add(requests[idx], request_id=str(idx))
+                batch.execute()
+            pending = sorted(idx for idx, exc in failures.items() if _is_retryable(exc))
+            if not pending or attempt == BATCH_RETRIES:
+                break
+            time.sleep(min(2 ** attempt, 32) + random.random())
+
+        if failures:
+            raise BatchError(
+                [labels[i] for i in range(len(requests)) if i not in failures],
+                [(labels[i], failures[i]) for i in sorted(failures)],
+            )
+        return responses
+
+    def rm_many(self, patterns: Sequence[str]) -> List[str]:
+        """
+        Remove every path/glob match in batched requests. Returns the removed
+        paths; raises BatchError listing removed and failed paths on errors.
+        Matches inside a folder that is itself being removed are not sent
+        separately: deleting the folder removes them, and their own delete
+        would only fail with 404.
+        """
+        by_id: Dict[str, DriveEntry] = {}
+        for pattern in patterns:
+            by_id.update((e.id, e) for e in self.expand(pattern))
+        entries = sorted(by_id.values(), key=lambda e: (e.path, e.id))
+        folders = {e.path.rstrip("/") + "/" for e in entries if e.is_dir}
+        top = [e for e in entries if not any(e.path.startswith(f) for f in folders)]
+        requests = [
+            self.service.files().delete(fileId=e.id, supportsAllDrives=True)
+            for e in top
+        ]
+        self._batch_execute(requests, [e.path for e in top])
+        return [e.path for e in entries]
+
+    def _require_folder(self, path: str) -> str:
+        abs_path = self.normalize_path(path)
+        if not self.is_dir(abs_path):
+            raise NotADirectoryError(f"❌ Not a folder: {abs_path}")
+        return self._folder_id(abs_path)
+
+    def mv_many(self, sources: Union[str, Sequence[DriveEntry]], dst_folder: str) -> List[Dict]:
+        """Move every match of a path/glob (or given entries) into an existing folder (batched)."""
+        entries = self._entries(sources)
+        new_parent_id = self._require_folder(dst_folder)
+        requests = [
+            self.service.files().update(
+                fileId=e.id,
+                addParents=new_parent_id,
+                removeParents=",".join(e.parents),
+                fields="id,name",
+                supportsAllDrives=True,
+            )
+            for e in entries
+        ]
+        return self._batch_execute(requests, [e.path for e in entries])
+
+    def cp_many(self, sources: Union[str, Sequence[DriveEntry]], dst_folder: str) -> List[Dict]:
+        """Copy every file matching a path/glob (or given entries) into an existing folder (batched)."""
+        entries = [e for e in self._entries(sources) if not e.is_dir]
+        parent_id = self._require_folder(dst_folder)
+        requests = [
+            self.service.files().copy(
+                fileId=e.id,
+                body={"name": e.name, "parents": [parent_id]},
+                fields="id,name",
+                supportsAllDrives=True,
+            )
+            for e in entries
+        ]
+        return self._batch_execute(requests, [e.path for e in entries])
+
+    def _resolve_dest(self, dst_path: str, keep_name: str) -> Tuple[str, str]:
+        """
+        (parent id, name) for an upload/mv/cp destination:
+        - dst_path is an existing folder (or a glob matching exactly one folder):
+          go into it and keep keep_name.
+        - Else: dst_path is the new full path; its parent folder must exist.
+        A glob matching several entries raises NotADirectoryError instead of
+        being used as a literal file name.
+        """
+        folder = self._glob_folder(dst_path)
+        if folder:
+            return folder.id, keep_name
+        if self.is_dir(dst_path):
+            return self.get_id_from_path(dst_path), keep_name
+        parent_path = posixpath.dirname(dst_path) or "/"
+        if not self.is_dir(parent_path):
+            raise FileNotFoundError(f"❌ Parent folder missing: {parent_path}")
+        return self._folder_id(parent_path), posixpath.basename(dst_path)
 
     def mv(self, src: str, dst: str) -> Dict:
         """
@@ -222,28 +955,18 @@ class GoogleDrive:
         src_meta = self.get_meta(src_path)
         src_id = src_meta["id"]
 
-        # Destination is existing folder → move into it, keep name
-        if self.exists(dst_path) and self.is_dir(dst_path):
-            new_parent_id = self.get_id_from_path(dst_path)
-            new_name = src_meta["name"]
-        else:
-            # Treat dst as full path with new name
-            parent_path = posixpath.dirname(dst_path) or "/"
-            if not self.exists(parent_path) or not self.is_dir(parent_path):
-                raise FileNotFoundError(f"❌ Parent folder missing: {parent_path}")
-            new_parent_id = self.get_id_from_path(parent_path)
-            new_name = posixpath.basename(dst_path)
+        new_parent_id, new_name = self._resolve_dest(dst_path, src_meta["name"])
 
-        # Fetch previous parents
-        file_parents = self.service.files().get(fileId=src_id, fields="parents").execute()
-        prev_parents = ",".join(file_parents.get("parents", []))
+        # Previous parents came with get_meta; no extra round trip needed
+        prev_parents = ",".join(src_meta.get("parents", []))
 
         updated = self.service.files().update(
             fileId=src_id,
             addParents=new_parent_id,
             removeParents=prev_parents,
             body={"name": new_name},
-            fields="id,name,parents"
+            fields="id,name",
+            supportsAllDrives=True,
         ).execute()
         return updated
 
@@ -256,49 +979,16 @@ class GoogleDrive:
         src_path = self.normalize_path(src)
         dst_path = self.normalize_path(dst)
 
-        src_meta = self.get_meta(src_path)
+        src_meta = self.get_meta(src_path, fields="id,name,mimeType")
         if src_meta.get("mimeType") == FOLDER_MIME:
             raise ValueError("❌ Copying folders is not supported by Drive API.")
 
         src_id = src_meta["id"]
 
-        if self.exists(dst_path) and self.is_dir(dst_path):
-            parent_id = self.get_id_from_path(dst_path)
-            name = src_meta["name"]
-        else:
-            parent_path = posixpath.dirname(dst_path) or "/"
-            if not self.exists(parent_path) or not self.is_dir(parent_path):
-                raise FileNotFoundError(f"❌ Parent folder missing: {parent_path}")
-            parent_id = self.get_id_from_path(parent_path)
-            name = posixpath.basename(dst_path)
+        parent_id, name = self._resolve_dest(dst_path, src_meta["name"])
 
         body = {"name": name, "parents": [parent_id]}
         created = self.service.files().copy(
-            fileId=src_id, body=body, fields="id,name,parents"
+            fileId=src_id, body=body, fields="id,name", supportsAllDrives=True
         ).execute()
         return created
-
-    def search(self, name=None, mimeType=None, modified_after=None, modified_before=None):
-        """Search files by name, mimeType, and modifiedTime."""
-        query_parts = []
-
-        if name:
-            query_parts.append(f"name contains '{name}'")
-        if mimeType:
-            query_parts.append(f"mimeType='{mimeType}'")
-        if modified_after:
-            dt = datetime.strptime(modified_after, "%Y-%m-%d").isoformat() + "Z"
-            query_parts.append(f"modifiedTime > '{dt}'")
-        if modified_before:
-            dt = datetime.strptime(modified_before, "%Y-%m-%d").isoformat() + "Z"
-            query_parts.append(f"modifiedTime < '{dt}'")
-
-        query = " and ".join(query_parts) if query_parts else None
-
-        results = self.service.files().list(
-            q=query,
-            fields="files(id, name, mimeType, modifiedTime, size)",
-            spaces="drive"
-        ).execute()
-
-        return results.get("files", [])
@@ -1,14 +1,27 @@
 # gd_connect/utils.py
 
+import functools
 import mimetypes
 import os
 import sys
 
 
+@functools.lru_cache(maxsize=1024)
+def _mime_type_for_suffix(suffix: str) -> str:
+    mime_type, _ = mimetypes.guess_type("file" + suffix)
+    return mime_type or "application/octet-stream"
+
+
 def guess_mime_type(filename: str) -> str:
     """
     Guess the MIME type of a file based on its extension.
     Defaults to 'application/octet-stream' if unknown.
+    Results are cached per extension, so bulk uploads of many files with the
+    same extension only do the lookup once, and match mimetypes.guess_type.
+    The key is the lowercased last suffix ('scan.2026.10.19.PDF' -> '.pdf').
+    When that suffix may be an encoding or a suffix_map alias, it keeps its
+    case (mimetypes matches encodings case-sensitively) and the suffix
+    before it is added ('a.tar.gz' -> '.tar.gz', 'notes.txt.GZ' -> '.txt.GZ').
 
     Parameters:
         filename (str): Path or name of the file.
@@ -16,8 +29,27 @@ def guess_mime_type(filename: str) -> str:
     Returns:
         str: MIME type string.
     """
-    mime_type, _ = mimetypes.guess_type(filename)
-    return mime_type or "application/octet-stream"
+    stem, suffix = os.path.splitext(os.path.basename(filename))
+    lower = suffix.lower()
+    if (
+        suffix in mimetypes.suffix_map or lower in mimetypes.suffix_map
+        or suffix in mimetypes.encodings_map or lower in mimetypes.encodings_map
+    ):
+        return _mime_type_for_suffix(os.path.splitext(stem)[1].lower() + suffix)
+    return _mime_type_for_suffix(lower)
+
+
+def escape_query(value: str) -> str:
+    """
+    Escape a literal for use inside a single-quoted Drive query string.
+
+    Parameters:
+        value (str): Raw value, e.g. a file name containing quotes.
+
+    Returns:
+        str: Value with backslashes and single quotes backslash-escaped.
+    """
+    return value.replace("\\", "\\\\").replace("'", "\\'")
 
 
 def ensure_file_exists(filepath: str):
@@ -59,7 +91,7 @@ def resolve_path(drive, path: str, create_missing=False):
     parent_id = "root"
 
     for i, part in enumerate(parts):
-        query = f"'{parent_id}' in parents and name='{part}' and trashed=false"
+        query = f"'{parent_id}' in parents and name='{escape_query(part)}' and trashed=false"
         results = drive.service.files().list(q=query, fields="files(id, name, mimeType)").execute().get("files", [])
 
         if not results:
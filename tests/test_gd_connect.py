@@ -1,8 +1,21 @@
 # tests/test_gd_connect.py
 
+import os
+import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
-from gd_connect.drive import GoogleDrive
+import json
+import mimetypes
+
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+from gd_connect.drive import (
+    BatchError, GoogleDrive, DriveEntry, FOLDER_MIME, _build_service, _corpus_args, build_query, has_magic,
+)
+from gd_connect import cli
+from gd_connect.utils import escape_query, _mime_type_for_suffix
 from gd_connect.utils import guess_mime_type, format_file_info
 
 
@@ -13,6 +26,34 @@ class TestUtils(unittest.TestCase):
     def test_guess_mime_type_unknown(self):
         self.assertEqual(guess_mime_type("file.unknownext"), "application/octet-stream")
 
+    def test_guess_mime_type_cached_per_extension(self):
+        _mime_type_for_suffix.cache_clear()
+        self.assertEqual(guess_mime_type("a/one.csv"), "text/csv")
+        self.assertEqual(guess_mime_type("b/two.csv"), "text/csv")
+        self.assertEqual(guess_mime_type("x.tar.gz"), "application/x-tar")
+        info = _mime_type_for_suffix.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+
+    def test_guess_mime_type_dotted_names_share_cache_key(self):
+        _mime_type_for_suffix.cache_clear()
+        self.assertEqual(guess_mime_type("scan.2026.10.19.pdf"), "application/pdf")
+        self.assertEqual(guess_mime_type("scan.2026.10.20.PDF"), "application/pdf")
+        self.assertEqual(guess_mime_type("Mr. Smith notes.txt"), "text/plain")
+        self.assertEqual(guess_mime_type("backup.tar.Z"), "application/x-tar")
+        info = _mime_type_for_suffix.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 3))
+
+    def test_guess_mime_type_matches_mimetypes(self):
+        names = [
+            "notes.txt.GZ", "a.GZ", "a.gz", "LOGS.TAR.GZ", "logs.tar.gz", "x.tar.Z",
+            "x.TAR.z", "a.TGZ", "b.svgz", "y.tar.bz2", "Mr. Smith notes.txt",
+            "scan.2026.10.19.PDF", "data.CSV", "archive.Tar.Xz", ".bashrc", "noext",
+        ]
+        for name in names:
+            with self.subTest(name=name):
+                expected = mimetypes.guess_type(name)[0] or "application/octet-stream"
+                self.assertEqual(guess_mime_type(name), expected)
+
     def test_format_file_info(self):
         file_data = {"id": "12345", "name": "test.txt"}
         self.assertEqual(format_file_info(file_data), "test.txt (12345)")
@@ -63,5 +104,556 @@ class TestGoogleDrive(unittest.TestCase):
         self.assertTrue(result)
 
 
+class TestBuildService(unittest.TestCase):
+    def test_keeps_client_http_defaults(self):
+        http = _build_service(Credentials("token"))._http.http
+        self.assertEqual(http.timeout, 60)
+        # Drive answers unfinished resumable chunks with a Location-less 308
+        self.assertNotIn(308, http.redirect_codes)
+
+
+class TestUploadMode(unittest.TestCase):
+    def setUp(self):
+        self.drive = GoogleDrive.__new__(GoogleDrive)
+        self.service = MagicMock()
+        fd, self.path = tempfile.mkstemp(suffix=".txt")
+        os.write(fd, b"x" * 100)
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _media(self, threshold):
+        self.drive._upload_to(self.service, self.path, "parent", "f.txt", threshold)
+        return self.service.files().create.call_args.kwargs["media_body"]
+
+    def test_small_file_is_multipart(self):
+        media = self._media(threshold=100)
+        self.assertFalse(media.resumable())
+        self.assertEqual(media.mimetype(), "text/plain")
+
+    def test_create_supports_shared_drives(self):
+        self._media(threshold=100)
+        self.assertTrue(self.service.files().create.call_args.kwargs["supportsAllDrives"])
+
+    def test_large_file_is_resumable(self):
+        self.assertTrue(self._media(threshold=99).resumable())
+
+    def test_upload_retries_rate_limits(self):
+        self._media(threshold=100)
+        execute = self.service.files().create.return_value.execute
+        self.assertEqual(execute.call_args.kwargs["num_retries"], 5)
+
+
+class TestUploadMany(unittest.TestCase):
+    def setUp(self):
+        self.drive = GoogleDrive.__new__(GoogleDrive)
+        self.drive._require_folder = MagicMock(return_value="P")
+        self.drive._thread_service = MagicMock()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = []
+        for name in ("a.txt", "b.txt", "c.txt"):
+            path = os.path.join(self.tmp.name, name)
+            with open(path, "wb") as fh:
+                fh.write(b"x")
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_results_keep_input_order(self):
+        barrier = threading.Barrier(3)
+
+        def upload(service, local_path, parent_id, name, threshold):
+            barrier.wait(timeout=5)
+            if name == "a.txt":
+                time.sleep(0.05)   # finishes last
+            return {"id": name, "parent": parent_id}
+
+        self.drive._upload_to = MagicMock(side_effect=upload)
+        created = self.drive.upload_many(self.paths, "/P", workers=3)
+        self.assertEqual([c["id"] for c in created], ["a.txt", "b.txt", "c.txt"])
+        self.assertTrue(all(c["parent"] == "P" for c in created))
+
+    def test_missing_local_file_fails_before_uploading(self):
+        self.drive._upload_to = MagicMock()
+        with self.assertRaises(FileNotFoundError):
+            self.drive.upload_many(self.paths + [os.path.join(self.tmp.name, "nope.txt")], "/P")
+        self.drive._upload_to.assert_not_called()
+        self.drive._require_folder.assert_not_called()
+
+    @patch("gd_connect.drive._build_service")
+    def test_each_worker_thread_gets_its_own_service(self, build_service):
+        build_service.side_effect = lambda creds: object()
+        del self.drive._thread_service   # use the real per-thread lookup
+        self.drive._creds = MagicMock()
+        self.drive._local = threading.local()
+        barrier = threading.Barrier(3)
+        seen = []
+
+        def upload(service, local_path, parent_id, name, threshold):
+            barrier.wait(timeout=5)
+            seen.append((threading.get_ident(), service))
+            return {"id": name}
+
+        self.drive._upload_to = MagicMock(side_effect=upload)
+        self.drive.upload_many(self.paths, "/P", workers=3)
+        self.assertEqual(len({t for t, _ in seen}), 3)
+        self.assertEqual(len({id(svc) for _, svc in seen}), 3)
+        self.assertEqual(build_service.call_count, 3)
+
+    def test_partial_failure_reports_uploaded_files(self):
+        def upload(service, local_path, parent_id, name, threshold):
+            if name == "b.txt":
+                raise _http_error(403, "userRateLimitExceeded")
+            return {"id": name}
+
+        self.drive._upload_to = MagicMock(side_effect=upload)
+        with self.assertRaises(BatchError) as ctx:
+            self.drive.upload_many(self.paths, "/P")
+        self.assertEqual(ctx.exception.succeeded, [self.paths[0], self.paths[2]])
+        self.assertEqual([p for p, _ in ctx.exception.failed], [self.paths[1]])
+
+
+class TestCliUpload(unittest.TestCase):
+    def _run(self, *args):
+        with patch("gd_connect.cli.GoogleDrive") as drive_cls, \
+                patch("sys.argv", ["gd-connect", "upload", *args]), \
+                patch("builtins.print"):
+            d = drive_cls.return_value
+            d.upload.return_value = {"id": "1", "name": "a"}
+            d.upload_many.return_value = [{"id": "1", "name": "a"}]
+            cli.main()
+        return d
+
+    def test_single_file_goes_to_cwd(self):
+        d = self._run("a.txt")
+        d.upload.assert_called_once_with("a.txt", None, 5 * 1024 * 1024)
+        d.upload_many.assert_not_called()
+
+    def test_two_args_are_local_and_remote(self):
+        d = self._run("a.txt", "/P/new.txt", "--multipart-threshold", "10")
+        d.upload.assert_called_once_with("a.txt", "/P/new.txt", 10)
+        d.upload_many.assert_not_called()
+
+    def test_more_args_upload_many_into_last(self):
+        d = self._run("a.txt", "b.txt", "c.txt", "/P", "--workers", "2")
+        d.upload_many.assert_called_once_with(["a.txt", "b.txt", "c.txt"], "/P", 2, 5 * 1024 * 1024)
+        d.upload.assert_not_called()
+
+
+class TestBuildQuery(unittest.TestCase):
+    def test_composes_and_escapes(self):
+        q = build_query(name="bob's", mimeType="application/pdf",
+                        modified_after="2026-01-02", owner="me@example.com")
+        self.assertEqual(q, (
+            "name contains 'bob\\'s' and mimeType = 'application/pdf'"
+            " and modifiedTime > '2026-01-02T00:00:00Z'"
+            " and 'me@example.com' in owners and trashed = false"
+        ))
+
+    def test_parents_are_ored(self):
+        q = build_query(parents=["a", "b"], folders_only=True)
+        self.assertEqual(q, (
+            "('a' in parents or 'b' in parents)"
+            " and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
+        ))
+
+
+class TestDriveEntry(unittest.TestCase):
+    def test_from_api(self):
+        entry = DriveEntry.from_api({"id": "1", "name": "a", "mimeType": FOLDER_MIME, "size": "42"})
+        self.assertTrue(entry.is_dir)
+        self.assertEqual(entry.size, 42)
+        self.assertEqual(entry["name"], "a")
+        self.assertIsNone(entry.get("modifiedTime"))
+        self.assertEqual(entry.get("path", "/"), "/")
+        self.assertFalse(hasattr(entry, "__dict__"))
+
+    def test_mapping_view(self):
+        entry = DriveEntry.from_api({"id": "1", "name": "a", "mimeType": "text/plain"})
+        self.assertIn("name", entry)
+        self.assertNotIn("size", entry)
+        self.assertNotIn(0, entry)
+        self.assertEqual(list(entry.keys()), ["id", "name", "mimeType"])
+        self.assertEqual(dict(entry), {"id": "1", "name": "a", "mimeType": "text/plain"})
+        self.assertEqual(dict(entry.items()), dict(entry))
+        with self.assertRaises(KeyError):
+            entry["size"]
+
+    def test_to_dict_skips_missing(self):
+        entry = DriveEntry.from_api({"id": "1", "name": "a"})
+        self.assertEqual(entry.to_dict(), {"id": "1", "name": "a"})
+
+
+def _fake_drive(tree):
+    """GoogleDrive whose listings come from {id: (name, mimeType, parent_id)}."""
+    drive = GoogleDrive.__new__(GoogleDrive)
+    drive.cwd_path = "/"
+    drive.service = MagicMock()
+
+    def iter_children(parent_ids, fields=None, page_size=None, drive_id=None,
+                      name=None, exact_name=None, folders_only=False, **_):
+        for fid, (fname, mime, parent) in tree.items():
+            if parent not in parent_ids:
+                continue
+            if folders_only and mime != FOLDER_MIME:
+                continue
+            if exact_name and fname != exact_name:
+                continue
+            if name and not fname.startswith(name):
+                continue
+            yield {"id": fid, "name": fname, "mimeType": mime, "parents": [parent]}
+
+    def get_child_by_name(parent_id, name, drive_id=None):
+        for fid, (fname, _, parent) in tree.items():
+            if parent == parent_id and fname == name:
+                return {"id": fid}
+        return None
+
+    def get(fileId, fields=None, **_):
+        fname, mime, parent = tree[fileId]
+        meta = {"id": fileId, "name": fname, "mimeType": mime, "parents": [parent]}
+        return MagicMock(execute=MagicMock(return_value=meta))
+
+    drive._iter_children = iter_children
+    drive._get_child_by_name = get_child_by_name
+    drive.service.files.return_value.get.side_effect = get
+    return drive
+
+
+class TestGlob(unittest.TestCase):
+    def setUp(self):
+        self.drive = _fake_drive({
+            "logs": ("logs", FOLDER_MIME, "root"),
+            "d1": ("2026-01", FOLDER_MIME, "logs"),
+            "d2": ("2026-02", FOLDER_MIME, "logs"),
+            "d3": ("2025-12", FOLDER_MIME, "logs"),
+            "f1": ("a.tmp", "text/plain", "d1"),
+            "f2": ("b.log", "text/plain", "d1"),
+            "f3": ("c.tmp", "text/plain", "d2"),
+            "f4": ("old.tmp", "text/plain", "d3"),
+            "sub": ("deep", FOLDER_MIME, "d2"),
+            "f5": ("d.tmp", "text/plain", "sub"),
+            "r": ("Reports [2026]", FOLDER_MIME, "root"),
+            "r1": ("Q1 [draft].pdf", "application/pdf", "r"),
+            "q": ("What?.txt", "text/plain", "root"),
+            "x": ("x", FOLDER_MIME, "root"),
+            "xa": ("data.csv", "text/csv", "x"),
+            "xb": ("data.csv", "text/csv", "x"),
+        })
+
+    def test_has_magic(self):
+        self.assertTrue(has_magic("/logs/*.tmp"))
+        self.assertTrue(has_magic("file[0-9]"))
+        self.assertFalse(has_magic("/logs/a.tmp"))
+
+    def test_escape_query(self):
+        self.assertEqual(escape_query("it's"), "it\\'s")
+
+    def test_glob_wildcards(self):
+        paths = [e.path for e in self.drive.glob("/logs/2026-*/*.tmp")]
+        self.assertEqual(paths, ["/logs/2026-01/a.tmp", "/logs/2026-02/c.tmp"])
+
+    def test_glob_double_star(self):
+        paths = [e.path for e in self.drive.glob("/logs/**/*.tmp")]
+        self.assertEqual(paths, [
+            "/logs/2025-12/old.tmp",
+            "/logs/2026-01/a.tmp",
+            "/logs/2026-02/c.tmp",
+            "/logs/2026-02/deep/d.tmp",
+        ])
+
+    def test_glob_shared_drive(self):
+        self.drive._shared_drive_ids = {"Team": "logs"}
+        self.assertEqual(self.drive._split_drive("//Team/a/b"), ("logs", "//Team", "a/b"))
+        paths = [e.path for e in self.drive.glob("//Team/2026-0[2-9]/*.tmp")]
+        self.assertEqual(paths, ["//Team/2026-02/c.tmp"])
+
+    def test_literal_fallback_for_glob_characters(self):
+        self.assertTrue(self.drive.exists("/Reports [2026]"))
+        self.assertTrue(self.drive.is_dir("/Reports [2026]/"))
+        self.assertEqual([e.id for e in self.drive.expand("/Reports [2026]/Q1 [draft].pdf")], ["r1"])
+        self.assertEqual([e.id for e in self.drive.expand("What?.txt")], ["q"])
+
+    def test_exists_and_is_dir_swallow_shared_drive_errors(self):
+        for error in (FileNotFoundError("missing"), ValueError("ambiguous")):
+            self.drive.get_shared_drive_id = MagicMock(side_effect=error)
+            self.assertFalse(self.drive.exists("//Nope/*.txt"))
+            self.assertFalse(self.drive.is_dir("//Nope/*"))
+            self.assertFalse(self.drive.exists("//Nope/a.txt"))
+
+    def test_is_dir_glob_needs_exactly_one_folder(self):
+        self.assertFalse(self.drive.is_dir("/logs/*"))
+        self.assertTrue(self.drive.is_dir("/logs/2026-0[1]"))
+        self.assertEqual(self.drive._require_folder("/logs/2026-0[1]"), "d1")
+        with self.assertRaises(NotADirectoryError):
+            self.drive._require_folder("/logs/*")
+
+    def test_destination_glob_must_name_one_folder(self):
+        self.assertEqual(self.drive._resolve_dest("/logs/2026-0[1]", "f.txt"), ("d1", "f.txt"))
+        self.assertEqual(self.drive._resolve_dest("/logs/new.txt", "f.txt"), ("logs", "new.txt"))
+        with self.assertRaises(NotADirectoryError):
+            self.drive._resolve_dest("/logs/*", "f.txt")
+
+    def test_escaped_brackets_in_pattern(self):
+        paths = [e.path for e in self.drive.glob("/Reports [[]2026]/*.pdf")]
+        self.assertEqual(paths, ["/Reports [2026]/Q1 [draft].pdf"])
+
+    def test_download_many_keeps_relative_paths(self):
+        self.drive._download_id = MagicMock()
+        self.drive._thread_service = MagicMock()
+        with tempfile.TemporaryDirectory() as out:
+            pairs = self.drive.download_many("/logs/**/*.tmp", out)
+            self.assertEqual([os.path.relpath(local, out) for _, local in pairs], [
+                os.path.join("2025-12", "old.tmp"),
+                os.path.join("2026-01", "a.tmp"),
+                os.path.join("2026-02", "c.tmp"),
+                os.path.join("2026-02", "deep", "d.tmp"),
+            ])
+            flat = self.drive.download_many("/logs/2026-01/*.tmp", out)
+            self.assertEqual(flat, [("/logs/2026-01/a.tmp", os.path.join(out, "a.tmp"))])
+
+    def test_download_many_rejects_colliding_names(self):
+        self.drive._download_id = MagicMock()
+        dupes = [
+            DriveEntry("1", "data.csv", "text/csv", path="/x/data.csv"),
+            DriveEntry("2", "data.csv", "text/csv", path="/x/data.csv"),
+        ]
+        with tempfile.TemporaryDirectory() as out:
+            with self.assertRaises(ValueError):
+                self.drive.download_many(dupes, out)
+        self.drive._download_id.assert_not_called()
+
+    def test_glob_keeps_duplicate_names(self):
+        self.assertEqual([e.id for e in self.drive.glob("/x/*.csv")], ["xa", "xb"])
+
+    def test_rm_many_deletes_every_duplicate(self):
+        self.drive._batch_execute = MagicMock()
+        self.assertEqual(self.drive.rm_many(["/x/*.csv"]), ["/x/data.csv", "/x/data.csv"])
+        deleted = [c.kwargs["fileId"] for c in self.drive.service.files().delete.call_args_list]
+        self.assertEqual(deleted, ["xa", "xb"])
+
+    def test_rm_many_skips_children_of_removed_folders(self):
+        self.drive._batch_execute = MagicMock()
+        removed = self.drive.rm_many(["/logs/**", "/logs/2026-02"])
+        self.assertIn("/logs/2026-02/deep/d.tmp", removed)
+        requests, labels = self.drive._batch_execute.call_args.args
+        self.assertEqual(labels, ["/logs/2025-12", "/logs/2026-01", "/logs/2026-02"])
+        self.assertEqual(len(requests), 3)
+
+    def test_download_many_rejects_duplicates_from_glob(self):
+        self.drive._download_id = MagicMock()
+        with tempfile.TemporaryDirectory() as out:
+            with self.assertRaises(ValueError):
+                self.drive.download_many("/x/*.csv", out)
+        self.drive._download_id.assert_not_called()
+
+    def test_glob_no_match(self):
+        self.assertEqual(self.drive.glob("/logs/1999-*/*"), [])
+        with self.assertRaises(FileNotFoundError):
+            self.drive.expand("/logs/1999-*")
+
+
+class TestSearch(unittest.TestCase):
+    PAGE_1 = {"files": [{"id": "1", "name": "r1"}, {"id": "2", "name": "r2"}],
+              "nextPageToken": "tok"}
+    PAGE_2 = {"files": [{"id": "3", "name": "r3"}]}
+
+    def setUp(self):
+        self.drive = GoogleDrive.__new__(GoogleDrive)
+        self.drive.cwd_path = "/"
+        self.drive.service = MagicMock()
+        self.list = self.drive.service.files.return_value.list
+        self.list.return_value.execute.side_effect = [self.PAGE_1, self.PAGE_2]
+
+    def test_pages_are_fetched_lazily(self):
+        results = self.drive.search(name="r")
+        self.list.assert_not_called()
+        self.assertEqual([next(results).id, next(results).id], ["1", "2"])
+        self.assertEqual(self.list.call_count, 1)
+        first = self.list.call_args_list[0].kwargs
+        self.assertEqual(first["q"], "name contains 'r' and trashed = false")
+        self.assertEqual(first["pageSize"], 1000)
+        self.assertIsNone(first["pageToken"])
+
+        self.assertEqual(next(results).id, "3")
+        self.assertEqual(self.list.call_count, 2)
+        self.assertEqual(self.list.call_args_list[1].kwargs["pageToken"], "tok")
+        self.assertEqual(list(results), [])
+
+    def test_limit_stops_before_next_page(self):
+        results = list(self.drive.search(name="r", limit=2))
+        self.assertEqual([e.id for e in results], ["1", "2"])
+        self.assertEqual(self.list.call_count, 1)
+        self.assertEqual(self.list.call_args.kwargs["pageSize"], 2)
+
+    def test_recursive_folder_search_with_limit(self):
+        drive = _fake_drive({
+            "logs": ("logs", FOLDER_MIME, "root"),
+            "d1": ("2026-01", FOLDER_MIME, "logs"),
+            "sub": ("deep", FOLDER_MIME, "d1"),
+            "f1": ("d.tmp", "text/plain", "sub"),
+        })
+        names = [e.name for e in drive.search(name="d", path="/logs", recursive=True)]
+        self.assertEqual(names, ["deep", "d.tmp"])
+        limited = list(drive.search(name="d", path="/logs", recursive=True, limit=1))
+        self.assertEqual([e.name for e in limited], ["deep"])
+        self.assertEqual(list(drive.search(name="d", path="/logs")), [])
+
+
+class TestSharedDrives(unittest.TestCase):
+    def setUp(self):
+        self.drive = GoogleDrive.__new__(GoogleDrive)
+        self.drive.cwd_path = "/"
+        self.drive._shared_drive_ids = {}
+        self.drive.service = MagicMock()
+        self.drives_list = self.drive.service.drives.return_value.list
+
+    def test_get_shared_drive_id_is_cached(self):
+        self.drives_list.return_value.execute.return_value = {"drives": [{"id": "D1"}]}
+        self.assertEqual(self.drive.get_shared_drive_id("Team"), "D1")
+        self.assertEqual(self.drive.get_shared_drive_id("Team"), "D1")
+        self.assertEqual(self.drives_list.call_count, 1)
+        self.assertEqual(self.drives_list.call_args.kwargs["q"], "name = 'Team'")
+        self.assertEqual(self.drives_list.call_args.kwargs["pageSize"], 2)
+
+    def test_missing_and_ambiguous_names(self):
+        self.drives_list.return_value.execute.return_value = {"drives": []}
+        with self.assertRaises(FileNotFoundError):
+            self.drive.get_shared_drive_id("Nope")
+        self.drives_list.return_value.execute.return_value = {
+            "drives": [{"id": "D1"}, {"id": "D2"}]
+        }
+        with self.assertRaises(ValueError):
+            self.drive.get_shared_drive_id("Team")
+
+    def test_list_shared_drives_skips_caching_duplicates(self):
+        self.drives_list.return_value.execute.return_value = {"drives": [
+            {"id": "D1", "name": "Team"}, {"id": "D2", "name": "Team"}, {"id": "D3", "name": "Ops"},
+        ]}
+        entries = self.drive.list_shared_drives()
+        self.assertEqual([e.path for e in entries], ["//Team", "//Team", "//Ops"])
+        self.assertTrue(all(e.is_dir for e in entries))
+        self.assertEqual(self.drive._shared_drive_ids, {"Ops": "D3"})
+
+    SHARED_CORPUS = {
+        "corpora": "drive",
+        "driveId": "D1",
+        "includeItemsFromAllDrives": True,
+        "supportsAllDrives": True,
+    }
+
+    def test_corpus_args(self):
+        self.assertEqual(_corpus_args("D1"), self.SHARED_CORPUS)
+        self.assertEqual(_corpus_args(None), {"spaces": "drive"})
+
+    def _list_kwargs(self):
+        return [c.kwargs for c in self.drive.service.files.return_value.list.call_args_list]
+
+    def test_path_lookup_uses_drive_corpus(self):
+        self.drive._shared_drive_ids = {"Team": "D1"}
+        files = self.drive.service.files.return_value
+        files.list.return_value.execute.return_value = {"files": [{"id": "F1"}]}
+        files.get.return_value.execute.return_value = {"id": "F1", "mimeType": FOLDER_MIME}
+
+        self.assertEqual(self.drive.get_id_from_path("//Team/Specs"), "F1")
+        (kwargs,) = self._list_kwargs()
+        self.assertEqual(kwargs["q"], "('D1' in parents) and name = 'Specs' and trashed = false")
+        self.assertEqual({k: kwargs[k] for k in self.SHARED_CORPUS}, self.SHARED_CORPUS)
+        self.assertNotIn("spaces", kwargs)
+
+        self.assertTrue(self.drive.is_dir("//Team/Specs"))
+        self.assertTrue(files.get.call_args.kwargs["supportsAllDrives"])
+
+    def test_my_drive_lookup_uses_user_space(self):
+        files = self.drive.service.files.return_value
+        files.list.return_value.execute.return_value = {"files": [{"id": "F1"}]}
+        self.drive.get_id_from_path("/Specs")
+        (kwargs,) = self._list_kwargs()
+        self.assertEqual(kwargs["spaces"], "drive")
+        self.assertNotIn("corpora", kwargs)
+
+    def test_ls_shared_drive_root(self):
+        self.drive._shared_drive_ids = {"Team": "D1"}
+        self.drive.service.files.return_value.list.return_value.execute.return_value = {
+            "files": [{"id": "F1", "name": "a.txt", "mimeType": "text/plain"}]
+        }
+        self.assertEqual([e.name for e in self.drive.ls("//Team")], ["a.txt"])
+        (kwargs,) = self._list_kwargs()
+        self.assertEqual(kwargs["q"], "('D1' in parents) and trashed = false")
+        self.assertEqual({k: kwargs[k] for k in self.SHARED_CORPUS}, self.SHARED_CORPUS)
+
+    def test_normalize_path_keeps_shared_prefix(self):
+        self.drive.cwd_path = "//Team/Specs"
+        self.assertEqual(self.drive.normalize_path("v2"), "//Team/Specs/v2")
+        self.assertEqual(self.drive.normalize_path("../Other/./x"), "//Team/Other/x")
+        # '..' from a shared drive root lands on the shared drive listing
+        self.drive.cwd_path = "//Team"
+        self.assertEqual(self.drive.normalize_path(".."), "//")
+        self.assertEqual(self.drive.normalize_path("/mine"), "/mine")
+        with self.assertRaises(FileNotFoundError):
+            self.drive.get_id_from_path("//")
+
+    def test_ls_double_slash_lists_shared_drives(self):
+        self.drives_list.return_value.execute.return_value = {
+            "drives": [{"id": "D1", "name": "Team"}]
+        }
+        self.assertEqual([e.path for e in self.drive.ls("//")], ["//Team"])
+        self.drive.service.files.return_value.list.assert_not_called()
+
+
+def _http_error(status, reason):
+    resp = MagicMock(status=status, reason=reason)
+    content = json.dumps({"error": {"errors": [{"reason": reason}], "message": reason}})
+    return HttpError(resp, content.encode())
+
+
+class TestBatchExecute(unittest.TestCase):
+    def setUp(self):
+        self.drive = GoogleDrive.__new__(GoogleDrive)
+        self.drive.service = MagicMock()
+        self.sent = []          # request ids per batch round trip
+        self.outcomes = {}      # request -> list of errors to raise before succeeding
+
+        def new_batch(callback):
+            batch, added = MagicMock(), []
+            batch.add.side_effect = lambda req, request_id: added.append((req, request_id))
+
+            def execute():
+                self.sent.append([rid for _, rid in added])
+                for req, rid in added:
+                    errs = self.outcomes.get(req, [])
+                    if errs:
+                        callback(rid, None, errs.pop(0))
+                    else:
+                        callback(rid, {"done": req}, None)
+            batch.execute.side_effect = execute
+            return batch
+
+        self.drive.service.new_batch_http_request.side_effect = new_batch
+
+    @patch("gd_connect.drive.time.sleep")
+    def test_rate_limited_calls_are_retried(self, sleep):
+        self.outcomes = {"b": [_http_error(403, "userRateLimitExceeded"), _http_error(429, "x")]}
+        responses = self.drive._batch_execute(["a", "b", "c"], ["/a", "/b", "/c"])
+        self.assertEqual(responses, [{"done": "a"}, {"done": "b"}, {"done": "c"}])
+        self.assertEqual(self.sent, [["0", "1", "2"], ["1"], ["1"]])
+        self.assertEqual(sleep.call_count, 2)
+
+    @patch("gd_connect.drive.time.sleep")
+    def test_failures_report_what_succeeded(self, sleep):
+        self.outcomes = {
+            "b": [_http_error(404, "notFound")],
+            "c": [_http_error(429, "rateLimitExceeded")] * 10,
+        }
+        with self.assertRaises(BatchError) as ctx:
+            self.drive._batch_execute(["a", "b", "c"], ["/a", "/b", "/c"])
+        self.assertEqual(ctx.exception.succeeded, ["/a"])
+        self.assertEqual([label for label, _ in ctx.exception.failed], ["/b", "/c"])
+        # the 404 is not retried; the 429 is retried until BATCH_RETRIES runs out
+        self.assertEqual(self.sent[1:], [["2"]] * 5)
+
+
 if __name__ == "__main__":
     unittest.main()